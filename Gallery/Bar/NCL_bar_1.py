@@ -32,12 +32,8 @@ dsoik = ds.DSOI_KET
 # Dates in the file are represented by year and month (YYYYMM)
 # representing them fractionally will make plotting the data easier
 # This produces the same results as NCL's yyyymm_to_yyyyfrac() function
-num_months = np.shape(date)[0]
-date_frac = np.empty_like(date)
-for n in np.arange(0, num_months, 1):
-    yyyy = int(date[n] / 100)
-    mon = (date[n] / 100 - yyyy) * 100
-    date_frac[n] = yyyy + (mon - 1) / 12
+yyyy, mm = np.divmod(date.values.astype(int), 100)
+date_frac = yyyy + (mm - 1) / 12
 
 ###############################################################################
 # Plot 1 (Bar chart)
@@ -89,17 +85,16 @@ ax = plt.gca()
 # Set offset
 offset = (date_frac[::8][1] - date_frac[::8][0]) / 2
 
-# Create barplot with outline
-xs = [date_frac[::8][0] - offset]
-ys = [0]
-for i in range(len(date_frac[::8])):
-    xs.append(date_frac[::8][i] - offset)
-    xs.append(date_frac[::8][i] + offset)
-    ys.append(dsoik[::8][i])
-    ys.append(dsoik[::8][i])
-
-xs.append(date_frac[::8][-1] + offset)
-ys.append(0)
+# Create barplot with outline. Every bar adds its left and right edges at its
+# own height, and the outline starts and ends at zero
+xs = np.concatenate(
+    [
+        [date_frac[::8][0] - offset],
+        np.column_stack([date_frac[::8] - offset, date_frac[::8] + offset]).ravel(),
+        [date_frac[::8][-1] + offset],
+    ]
+)
+ys = np.concatenate([[0], np.repeat(dsoik[::8].values, 2), [0]])
 
 ax.plot(xs, ys, color="black", linewidth=0.5)
 
@@ -32,16 +32,12 @@ import matplotlib.pyplot as plt
 ds = xr.open_dataset(gdf.get("netcdf_files/soi.nc"))
 dsoik = ds.DSOI_KET
 date = ds.date
-num_months = np.shape(date)[0]
 
 # Dates in the file are represented by year and month (YYYYMM)
 # representing them fractionally will make plotting the data easier
 # This produces the same results as NCL's yyyymm_to_yyyyfrac() function
-date_frac = np.empty_like(date)
-for n in np.arange(0, num_months, 1):
-    yyyy = int(date[n] / 100)
-    mon = (date[n] / 100 - yyyy) * 100
-    date_frac[n] = yyyy + (mon - 1) / 12
+yyyy, mm = np.divmod(date.values.astype(int), 100)
+date_frac = yyyy + (mm - 1) / 12
 
 ###############################################################################
 # Plot
@@ -50,8 +46,8 @@ for n in np.arange(0, num_months, 1):
 plt.figure(figsize=(12, 6))
 ax = plt.axes()
 
-# Create a list of colors based on the color bar values
-colors = ['red' if (value > 0) else 'blue' for value in dsoik[::8]]
+# Create an array of colors based on the sign of the bar values
+colors = np.where(dsoik[::8] > 0, 'red', 'blue')
 plt.bar(
     date_frac[::8],
     dsoik[::8],
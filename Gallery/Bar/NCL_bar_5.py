@@ -36,12 +36,8 @@ sst = sst * 0.1
 # Dates in the file are represented by year and month (YYYYMM)
 # representing them fractionally will make plotting the data easier
 # This produces the same results as NCL's yyyymm_to_yyyyfrac() function
-num_months = np.shape(date)[0]
-date_frac = np.empty_like(date)
-for n in np.arange(0, num_months, 1):
-    yyyy = int(date[n] / 100)
-    mon = (date[n] / 100 - yyyy) * 100
-    date_frac[n] = yyyy + (mon - 1) / 12
+yyyy, mm = np.divmod(date.values.astype(int), 100)
+date_frac = yyyy + (mm - 1) / 12
 
 ###############################################################################
 # Plot:
@@ -84,9 +80,8 @@ for ax, year in zip(ax_dict, warm):
     year_start = year - 1
     year_end = year + 3
 
-    # Find the indices for each of the year limits
-    year_istart = int((np.where(np.round(date_frac, 3) == year_start)[0]).item())
-    year_iend = int((np.where(np.round(date_frac, 3) == year_end)[0]).item())
+    # Find the indices for each of the year limits in the sorted dates
+    year_istart, year_iend = np.searchsorted(date_frac, [year_start, year_end])
 
     # Create each bar chart where it is red if it is above 0 and blue if below
     ax_dict[ax].bar(
@@ -94,9 +89,7 @@ for ax, year in zip(ax_dict, warm):
         sst[year_istart:year_iend],
         align='edge',
         edgecolor='black',
-        color=[
-            'red' if (value > 0) else 'blue' for value in sst[year_istart:year_iend]
-        ],
+        color=np.where(sst[year_istart:year_iend] > 0, 'red', 'blue'),
         width=0.08,
         linewidth=1,
     )
@@ -188,9 +181,8 @@ for year in warm:
     year_start = year - 1
     year_end = year + 3
 
-    # Find the indices for each of the year limits
-    year_istart = int((np.where(np.round(date_frac, 3) == year_start)[0]).item())
-    year_iend = int((np.where(np.round(date_frac, 3) == year_end)[0]).item())
+    # Find the indices for each of the year limits in the sorted dates
+    year_istart, year_iend = np.searchsorted(date_frac, [year_start, year_end])
 
     # Create each bar chart where it is red if it is above 0 and blue if below
     ax2[i].bar(
@@ -198,9 +190,7 @@ for year in warm:
         sst[year_istart:year_iend],
         align='edge',
         edgecolor='black',
-        color=[
-            'red' if (value > 0) else 'blue' for value in sst[year_istart:year_iend]
-        ],
+        color=np.where(sst[year_istart:year_iend] > 0, 'red', 'blue'),
         width=0.08,
         linewidth=1,
     )
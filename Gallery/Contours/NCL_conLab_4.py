@@ -36,11 +36,10 @@ ds = xr.open_dataset(gdf.get("netcdf_files/uv300.nc"), decode_times=False)
 U = ds.isel(time=1, drop=True).U
 
 # Reduce the dataset to something just bigger than the area we want to plot.
-# This will improve how the contour lines are labeled
-U = U.where(U.lon >= 0)
-U = U.where(U.lon <= 71)
-U = U.where(U.lat >= -33)
-U = U.where(U.lat <= 33)
+# This will improve how the contour lines are labeled. Cropping with
+# coordinate slices, rather than masking everything outside the area, means
+# only the area itself is copied and contoured
+U = U.sel(lon=slice(0, 71), lat=slice(-33, 33))
 
 ##############################################################################
 # Plot:
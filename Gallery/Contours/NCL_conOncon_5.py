@@ -147,14 +147,18 @@ colorlist = [
     "violet",
 ]
 
+# Read the data at the 12*x+1 timesteps (x = 0, ..., 17) from the file in a
+# single strided read, rather than one read per timestep
+hgt = ds.HGT.isel(time=slice(1, 12 * 18, 12)).load()
+
+# Use geocat-viz utility function to handle the no-shown-data artifact
+# of 0 and 360-degree longitudes
+hgt = gv.xr_add_cyclic_longitudes(hgt, "lon")
+
 # Iterate through 18 different timesteps
 for x in range(18):
     # Get a slice of data at the 12*x+1 timestep
-    p = ds.HGT.isel(time=12 * x + 1)
-
-    # Use geocat-viz utility function to handle the no-shown-data artifact
-    # of 0 and 360-degree longitudes
-    slon = gv.xr_add_cyclic_longitudes(p, "lon")
+    slon = hgt.isel(time=x)
 
     # Plot contour data at pressure level 5500 for the 12*x+1 timestep
     p = slon.plot.contour(
@@ -85,7 +85,16 @@ endDate = f'{yearEnd}-12-31'
 ds = ds.sel(time=slice(startDate, endDate))
 
 ###############################################################################
-# Compute desired global seasonal mean using month_to_season()
+# Subset data to the North Atlantic region:
+
+# Seasonal averaging and weighting are applied independently at every grid
+# point, so subsetting the region first means only the grid points that are
+# actually used in the EOF analysis are aggregated.
+
+ds = ds.sel(lat=slice(latS, latN), lon=slice(lonL, lonR))
+
+###############################################################################
+# Compute desired seasonal mean using month_to_season()
 
 # Choose the winter season (December-January-February)
 season = "DJF"
@@ -102,17 +111,12 @@ clat = np.sqrt(np.cos(np.deg2rad(clat)))
 # Xarray will apply latitude-based weights to all longitudes and timesteps automatically.
 # This is called "broadcasting".
 
-wSLP = SLP
-wSLP['slp'] = SLP['slp'] * clat
+xw = SLP
+xw['slp'] = SLP['slp'] * clat
 
 # For now, metadata for slp must be copied over explicitly; it is not preserved by binary operators like multiplication.
-wSLP['slp'].attrs = ds['slp'].attrs
-wSLP['slp'].attrs['long_name'] = 'Wgt: ' + wSLP['slp'].attrs['long_name']
-
-###############################################################################
-# Subset data to the North Atlantic region:
-
-xw = wSLP.sel(lat=slice(latS, latN), lon=slice(lonL, lonR))
+xw['slp'].attrs = ds['slp'].attrs
+xw['slp'].attrs['long_name'] = 'Wgt: ' + xw['slp'].attrs['long_name']
 
 ###############################################################################
 # Compute the EOFs:
@@ -56,6 +56,21 @@ ps = ds.PS
 ps = ps / 100  # Convert from pascal to millibar
 lev_p = np.array([300, 400, 500, 600, 700, 800, 900, 1000])
 
+
+# Only a single meridional slice is plotted, so subset the data (and the
+# surface pressure used to build the hybrid pressure levels) before the
+# interpolation rather than remapping the whole global field. List indexers
+# keep the time and lon dimensions as length-1 so the inputs keep the shape
+# interp_hybrid_to_pressure expects; they are squeezed out afterwards.
+def extract_slice(da):
+    return da.isel(time=[0]).sel(lat=slice(-30, 30)).sel(lon=[210], method='nearest')
+
+
+h = extract_slice(h)
+omega = extract_slice(omega)
+V = extract_slice(V)
+ps = extract_slice(ps)
+
 # interp_hybrid_to_pressure is the Python version of vinth2p in NCL script
 hp = interp_hybrid_to_pressure(
     data=h, ps=ps, hyam=hyam, hybm=hybm, p0=P0mb, new_levels=lev_p, method='log'
@@ -71,10 +86,10 @@ vp = interp_hybrid_to_pressure(
     data=V, ps=ps, hyam=hyam, hybm=hybm, p0=P0mb, new_levels=lev_p, method='log'
 )
 
-# Extract slices of the data
-hp = hp.isel(time=0).sel(lat=slice(-30, 30)).sel(lon=210, method='nearest')
-op = op.isel(time=0).sel(lat=slice(-30, 30)).sel(lon=210, method='nearest')
-vp = vp.isel(time=0).sel(lat=slice(-30, 30)).sel(lon=210, method='nearest')
+# Drop the length-1 time and lon dimensions of the interpolated slices
+hp = hp.squeeze(['time', 'lon'])
+op = op.squeeze(['time', 'lon'])
+vp = vp.squeeze(['time', 'lon'])
 
 # Set vp equal to zero so that we plot only the vertical component
 # while retaining the coordinate information
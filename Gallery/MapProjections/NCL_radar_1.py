@@ -3,6 +3,8 @@ NCL_radar_1.py
 ===============
 This script illustrates the following concepts:
    - Fitting radial data to a cartesian grid
+   - Precomputing a polar-to-cartesian resampling index
+   - Drawing gridded data with imshow and discrete color levels
    - Creating a horizontal colorbar
    - Adding a background behind plotted data
    - Creating a square aspect ratio
@@ -18,6 +20,7 @@ See following URLs to see the reproduced NCL plot & script:
 import numpy as np
 import xarray as xr
 import matplotlib.pyplot as plt
+from matplotlib.colors import BoundaryNorm
 import cmaps
 
 import geocat.datafiles as gdf
@@ -48,25 +51,62 @@ values = values * 100
 theta = ds.Azimuth.data
 theta[0:63] = theta[0:63] - 360
 
-# Make a cartesian mesh grid
-radius_matrix, theta_matrix = np.meshgrid(r, theta)
-X = radius_matrix * np.cos(np.deg2rad(theta_matrix))
-Y = radius_matrix * np.sin(np.deg2rad(theta_matrix))
+##############################################################################
+# Resample the radial data to a cartesian grid:
+
+
+# Compute, for every cell of a cartesian grid, the index of the nearest
+# azimuth and range bin of the radar. The index only depends on the radar
+# geometry (azimuths and range gates), so it is computed once and every sweep
+# measured with the same configuration is then resampled by a single gather.
+def polar_to_cartesian_index(theta, r, half_width, resolution):
+    x = np.arange(-half_width, half_width, resolution) + resolution / 2
+    X, Y = np.meshgrid(x, x)
+
+    # Nearest range bin; cells beyond the last range bin are invalid
+    range_index = np.round(np.hypot(X, Y) / (r[1] - r[0])).astype(int)
+    valid = range_index < len(r)
+    range_index = np.where(valid, range_index, 0)
+
+    # Nearest azimuth, wrapping around from the last azimuth to the first
+    cell_theta = (np.rad2deg(np.arctan2(Y, X)) - theta[0]) % 360 + theta[0]
+    theta_wrap = np.append(theta, theta[0] + 360)
+    upper = np.searchsorted(theta_wrap, cell_theta).clip(1, len(theta))
+    use_lower = cell_theta - theta_wrap[upper - 1] < theta_wrap[upper] - cell_theta
+    azimuth_index = np.where(use_lower, upper - 1, upper) % len(theta)
+
+    return azimuth_index, range_index, valid
+
+
+# Resample the 1/4 km radial data to a 1/2 km cartesian grid
+half_width = 240
+azimuth_index, range_index, valid = polar_to_cartesian_index(
+    theta, r, half_width, resolution=0.5
+)
+gridded = np.where(valid, values[azimuth_index, range_index], np.nan)
 
 ##############################################################################
 # Plotting helper function
 
 
-def radar_plot(X, Y, values, bg_color=None):
+def radar_plot(gridded, bg_color=None):
     # Create a figure and axes using subplots
     fig, ax = plt.subplots(figsize=(6, 8))
 
-    # Choose default colormap
+    # Choose default colormap and the discrete levels to color by
     cmap = cmaps.gui_default
-
-    # Plot using contourf
-    p = plt.contourf(
-        X, Y, values, cmap=cmap, levels=np.arange(-20, 70, 5) * 100, zorder=3
+    levels = np.arange(-20, 70, 5) * 100
+    norm = BoundaryNorm(levels, cmap.N)
+
+    # Plot using imshow, leaving values outside of the levels blank
+    p = plt.imshow(
+        np.ma.masked_outside(gridded, levels[0], levels[-1]),
+        cmap=cmap,
+        norm=norm,
+        extent=(-half_width, half_width, -half_width, half_width),
+        origin='lower',
+        interpolation='nearest',
+        zorder=3,
     )
 
     # Change orientation and tick marks of colorbar
@@ -120,10 +160,10 @@ def radar_plot(X, Y, values, bg_color=None):
 # Plot:
 
 # Generate first plot without a background using the helper function
-radar_plot(X, Y, values)
+radar_plot(gridded)
 
 ##############################################################################
 # Alternative plot:
 
 # Generate alternative plot with a background
-radar_plot(X, Y, values, bg_color="lightgrey")
+radar_plot(gridded, bg_color="lightgrey")
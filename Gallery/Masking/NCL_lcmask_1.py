@@ -79,11 +79,54 @@ gv.set_titles_and_labels(
 plt.show()
 
 ###############################################################################
-# Mask data
-masked = V.where(V.lat > 20)
-masked = masked.where(masked.lat < 80)
-masked = masked.where(masked.lon > 90)
-masked = masked.where(masked.lon < 220)
+# Utility functions:
+
+
+# Convert the bounds of a box into a slice of indices along a monotonically
+# increasing coordinate. Points strictly inside the bounds are kept, plus
+# `halo` extra points on each side.
+def box_slice(coord, lower, upper, halo=0):
+    start = np.searchsorted(coord, lower, side="right")
+    stop = np.searchsorted(coord, upper, side="left")
+    return slice(max(start - halo, 0), min(stop + halo, coord.size))
+
+
+# Crop a lat/lon box out of a global field instead of masking everything
+# outside of it, so that only the region is copied and contoured. When the
+# western bound is larger than the eastern one, the box crosses the seam of the
+# longitude coordinate: the two pieces on either side of the seam are joined
+# and the longitudes of the second piece are shifted by 360 degrees.
+def crop_box(da, lat_bounds, lon_bounds, halo=0):
+    lat = da["lat"].values
+    lon = da["lon"].values
+    ilat = box_slice(lat, *lat_bounds, halo=halo)
+
+    west, east = lon_bounds
+    if west < east:
+        return da.isel(lat=ilat, lon=box_slice(lon, west, east, halo=halo))
+
+    # Leave out a cyclic column at the end, which repeats the first longitude
+    nlon = np.searchsorted(lon, lon[0] + 360)
+    before_seam = box_slice(lon[:nlon], west, np.inf, halo=halo)
+    after_seam = box_slice(lon, -np.inf, east, halo=halo)
+    ilon = np.r_[np.arange(lon.size)[before_seam], np.arange(lon.size)[after_seam]]
+    cropped = da.isel(lat=ilat, lon=ilon)
+    return cropped.assign_coords(lon=np.r_[lon[before_seam], lon[after_seam] + 360])
+
+
+###############################################################################
+# Crop data
+
+# Keep one extra grid point around the box, so that the filled contours reach
+# the map boundary drawn below instead of stopping short of it
+halo = 1
+masked = crop_box(V, lat_bounds=(20, 80), lon_bounds=(90, 220), halo=halo)
+
+# Clip the halo into the range of the points inside the box, so that the
+# contour levels picked by xarray only depend on the box and every halo value
+# still falls within them
+box = masked.isel(lat=slice(halo, -halo), lon=slice(halo, -halo))
+masked = masked.clip(box.min(), box.max())
 
 # Rotate data to match NCL example
 masked['lon'] = masked['lon'] + 180
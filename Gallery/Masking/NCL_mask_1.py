@@ -37,11 +37,21 @@ ds = ds.isel(time=0, drop=True)
 ###############################################################################
 # Data Masking:
 
-# Use xarray.DataArray.where() function to mask out land and then ocean data
-land_only = ds.TS.where(ds.ORO == 1.0)
-ocean_only = ds.TS.where(ds.ORO == 0.0)
-land_only = gv.xr_add_cyclic_longitudes(land_only, "lon")
-ocean_only = gv.xr_add_cyclic_longitudes(ocean_only, "lon")
+# Fix the artifact of not-shown-data around 0 and 360-degree longitudes once
+# for the data and for the land-ocean field, so that both masked fields below
+# share the same wrapped arrays instead of each being wrapped separately
+TS = gv.xr_add_cyclic_longitudes(ds.TS, "lon")
+ORO = gv.xr_add_cyclic_longitudes(ds.ORO, "lon")
+
+# Compare the land-ocean field against both surface types at once, giving a
+# boolean mask with a new "surface" dimension, and apply it with a single call
+# to xarray.DataArray.where() to mask out land and ocean data together
+surface = xr.DataArray(
+    [0.0, 1.0], dims="surface", coords={"surface": ["ocean", "land"]}
+)
+by_surface = TS.where(ORO == surface)
+ocean_only = by_surface.sel(surface="ocean", drop=True)
+land_only = by_surface.sel(surface="land", drop=True)
 
 ###############################################################################
 # Plot Ocean Only:
@@ -47,6 +47,42 @@ vgrid = ds.vgrid
 rain03 = ds.rain03
 tempht = ds.tempht
 
+###############################################################################
+# Define the time axis labels:
+
+# Labels for each 3-hourly forecast time, shared by all of the panels. The
+# bar and line charts only label every other tick.
+time_labels = [
+    '12z',
+    '15z',
+    '18z',
+    '21z',
+    'Apr29',
+    '03z',
+    '06z',
+    '09z',
+    '12z',
+    '15z',
+    '18z',
+    '21z',
+    'Apr30',
+    '03z',
+    '06z',
+    '09z',
+    '12z',
+    '15z',
+    '18z',
+    '21z',
+    'May01',
+    '03z',
+    '06z',
+    '09z',
+    '12z',
+]
+sparse_time_labels = [
+    label if n % 2 == 0 else '' for n, label in enumerate(time_labels)
+]
+
 ###############################################################################
 # Plot:
 
@@ -92,12 +128,13 @@ contour1 = ax1.contourf(
     zorder=2,
 )
 
-# Plot black outlines on top of the filled rh contours
+# Plot black outlines on top of the filled rh contours. They are drawn from the
+# filled contour set, which reuses its levels and contour generator instead of
+# contouring rh a second time
 contour2 = ax1.contour(
-    rh,
+    contour1,
     transform=ccrs.PlateCarree(),
     colors='black',
-    levels=contour_levels,
     linewidths=0.1,
     zorder=3,
 )
@@ -162,33 +199,7 @@ cont3labels = ax1.clabel(
 
 # Determine the labels for each tick on the x and y axes
 yticklabels = np.array(levels, dtype=np.int32)
-xticklabels = [
-    '12z',
-    '15z',
-    '18z',
-    '21z',
-    'Apr29',
-    '03z',
-    '06z',
-    '09z',
-    '12z',
-    '15z',
-    '18z',
-    '21z',
-    'Apr30',
-    '03z',
-    '06z',
-    '09z',
-    '12z',
-    '15z',
-    '18z',
-    '21z',
-    'May01',
-    '03z',
-    '06z',
-    '09z',
-    '12z',
-]
+xticklabels = time_labels
 
 # Make an axis to overlay on top of the contour plot
 axin = fig.add_subplot(spec[0, 0])
@@ -259,33 +270,7 @@ gv.set_titles_and_labels(axin1, ylabel='3hr rain total', labelfontsize=12)
 
 # Determine the labels for each tick on the x and y axes
 yticklabels = ['0.0', '0.10', '0.20', '0.30', '0.40', '0.50']
-xticklabels = [
-    '12z',
-    '',
-    '18z',
-    '',
-    'Apr29',
-    '',
-    '06z',
-    '',
-    '12z',
-    '',
-    '18z',
-    '',
-    'Apr30',
-    '',
-    '06z',
-    '',
-    '12z',
-    '',
-    '18z',
-    '',
-    'May01',
-    '',
-    '06z',
-    '',
-    '12z',
-]
+xticklabels = sparse_time_labels
 
 # Use the geocat.viz function to set axes limits and ticks
 gv.set_axes_limits_and_ticks(
@@ -315,33 +300,7 @@ gv.set_titles_and_labels(axin2, ylabel='Temp at 2m', labelfontsize=12)
 
 # Determine the labels for each tick on the x and y axes
 yticklabels = ['59.0', '60.0', '61.0', '62.0', '63.0', '64.0']
-xticklabels = [
-    '12z',
-    '',
-    '18z',
-    '',
-    'Apr29',
-    '',
-    '06z',
-    '',
-    '12z',
-    '',
-    '18z',
-    '',
-    'Apr30',
-    '',
-    '06z',
-    '',
-    '12z',
-    '',
-    '18z',
-    '',
-    'May01',
-    '',
-    '06z',
-    '',
-    '12z',
-]
+xticklabels = sparse_time_labels
 
 # Use the geocat.viz function to set inset axes limits and ticks
 gv.set_axes_limits_and_ticks(
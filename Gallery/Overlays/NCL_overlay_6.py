@@ -160,14 +160,40 @@ with np.errstate(
         zorder=5,
     )
 
-# Divide streamlines into segments
+# Stack the vertices of all streamline segments into a single array, keeping
+# track of which segment each vertex belongs to
 seg = streams.lines.get_segments()
-# Determine how many arrows on each streamline, the placement, and angles of the arrows
-period = 7
-arrow_x = np.array([seg[i][0, 0] for i in range(0, len(seg), period)])
-arrow_y = np.array([seg[i][0, 1] for i in range(0, len(seg), period)])
-arrow_dx = np.array([seg[i][1, 0] - seg[i][0, 0] for i in range(0, len(seg), period)])
-arrow_dy = np.array([seg[i][1, 1] - seg[i][0, 1] for i in range(0, len(seg), period)])
+points = np.concatenate(seg)
+seg_id = np.repeat(np.arange(len(seg)), [len(s) for s in seg])
+
+# Compute the start point and direction of every step along the streamlines,
+# skipping the jumps from the end of one segment to the start of the next
+same_seg = seg_id[1:] == seg_id[:-1]
+step_start = points[:-1][same_seg]
+step_end = points[1:][same_seg]
+step_delta = step_end - step_start
+
+# A new streamline starts wherever a step does not continue from the end of
+# the previous one (depending on the Matplotlib version, a streamline is
+# stored either as one segment or as many two-point segments)
+first_step = np.r_[True, np.any(step_start[1:] != step_end[:-1], axis=1)]
+
+# Compute the distance along its streamline at which every step starts
+step_length = np.hypot(step_delta[:, 0], step_delta[:, 1])
+distance = np.cumsum(step_length) - step_length
+distance -= np.maximum.accumulate(np.where(first_step, distance, 0))
+
+# Place the arrows by arc length rather than by segment index: one arrow at
+# the start of every streamline and then one every `spacing` (in projection
+# units, i.e. meters) along it
+spacing = 5e5
+bucket = np.floor(distance / spacing)
+arrows = first_step | np.r_[True, bucket[1:] != bucket[:-1]]
+
+# Determine the placement and angles of the arrows
+arrow_x, arrow_y = step_start[arrows].T
+arrow_dx, arrow_dy = step_delta[arrows].T
+
 # Add arrows to streamlines
 q = ax.quiver(
     arrow_x,
@@ -46,14 +46,12 @@ TS = gv.xr_add_cyclic_longitudes(TS, "lon")
 # Calculate zonal mean
 mean = TS.mean(dim='lon')
 
-# Using meshgrid, a 2-D array can be created with the same shape as the
-# temperature data with the zonal mean for each latitude filling each row.
-# This way we can subtract each element of the mean 2-D array from the
-# corresponding element in the data array.
-waste, mean_grid = np.meshgrid(TS['lon'], mean)
-
-# Calculate deviations from zonal mean
-dev = TS.data - mean_grid
+# Calculate deviations from zonal mean. xarray broadcasts the zonal mean
+# (one value per latitude) against the longitude dimension of the data, so
+# there is no need to build a full-size 2-D array of the mean first. This
+# works for any leading dimensions (e.g. time) and stays lazy if the data
+# is backed by dask.
+dev = TS - mean
 
 ##############################################################################
 # Plot:
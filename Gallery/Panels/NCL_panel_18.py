@@ -34,12 +34,14 @@ ds = xr.open_dataset(
     gdf.get("netcdf_files/TS.cam3.toga_ENS.1950-2000.nc"), decode_times=False
 )
 
-# Fix the artifact of not-shown-data around 0 and 360-degree longitudes
-TS = gv.xr_add_cyclic_longitudes(ds.TS, "lon")
+# Extract variables from data. The file is read lazily, so selecting the two
+# time steps first means only those slices are read from disk
+yr0 = ds.TS[12, :, :]
+yr1 = ds.TS[600, :, :]
 
-# Extract variables from data
-yr0 = TS[12, :, :]
-yr1 = TS[600, :, :]
+# Fix the artifact of not-shown-data around 0 and 360-degree longitudes
+yr0 = gv.xr_add_cyclic_longitudes(yr0, "lon")
+yr1 = gv.xr_add_cyclic_longitudes(yr1, "lon")
 yr0 = yr0 - 273.15  # convert to degree C
 yr1 = yr1 - 273.15  # convert to degree C
 
@@ -103,10 +103,15 @@ def add_axes(fig, grid_space, date):
 
 
 ##############################################################################
-# Helper function to create figure with specific gridspec
+# Helper function to create figure with specific gridspec. It returns the filled
+# contour sets of the four panels; if the contour sets of a previous figure of
+# the same data are passed in, the filled contours are drawn from those, which
+# reuses their levels and contour generators instead of setting them up again
+# from the data. The filled contours themselves are still computed for each
+# figure
 
 
-def create_fig(grid, fig, title):
+def create_fig(grid, fig, title, contour_sets=None):
     # Add the axes
     ax1 = add_axes(fig, grid[0, 0], dates[0])
     ax2 = add_axes(fig, grid[0, 1], dates[1])
@@ -127,15 +132,29 @@ def create_fig(grid, fig, title):
     )
 
     # Plot the filled contours
-    contour1 = data1.plot.contourf(ax=ax1, **contourf_kw)
-    contour2 = data2.plot.contourf(ax=ax2, **contourf_kw)
-    contour3 = data3.plot.contourf(ax=ax3, **contourf_kw)
-    contour4 = data4.plot.contourf(ax=ax4, **contourf_kw)
+    axes = [ax1, ax2, ax3, ax4]
+    if contour_sets is None:
+        contours = [
+            data.plot.contourf(ax=ax, **contourf_kw)
+            for ax, data in zip(axes, [data1, data2, data3, data4])
+        ]
+    else:
+        contours = [
+            ax.contourf(
+                contour_set,
+                cmap=contour_set.cmap,
+                norm=contour_set.norm,
+                extend=contour_set.extend,
+                transform=contourf_kw['transform'],
+                zorder=contourf_kw['zorder'],
+            )
+            for ax, contour_set in zip(axes, contour_sets)
+        ]
 
     # Add colorbar for all four plots
     fig.colorbar(
-        contour4,
-        ax=[ax1, ax2, ax3, ax4],
+        contours[-1],
+        ax=axes,
         ticks=np.linspace(-5, 5, 11),
         drawedges=True,
         orientation='horizontal',
@@ -150,6 +169,8 @@ def create_fig(grid, fig, title):
 
     plt.show()
 
+    return contours
+
 
 ##############################################################################
 # Read in data:
@@ -159,17 +180,14 @@ ds = xr.open_dataset(gdf.get("netcdf_files/sst8292a.nc"))
 
 dates = [198212, 199008, 198705, 198411]
 
-data1 = ds.sel(time=11).SSTA
-data1 = gv.xr_add_cyclic_longitudes(data1, 'lon')
-
-data2 = ds.sel(time=103).SSTA
-data2 = gv.xr_add_cyclic_longitudes(data2, 'lon')
-
-data3 = ds.sel(time=64).SSTA
-data3 = gv.xr_add_cyclic_longitudes(data3, 'lon')
+# Add the cyclic longitude once for all four plotted time steps; the
+# individual panels are views into the wrapped array
+ssta = gv.xr_add_cyclic_longitudes(ds.SSTA.sel(time=[11, 103, 64, 34]), 'lon')
 
-data4 = ds.sel(time=34).SSTA
-data4 = gv.xr_add_cyclic_longitudes(data4, 'lon')
+data1 = ssta.sel(time=11)
+data2 = ssta.sel(time=103)
+data3 = ssta.sel(time=64)
+data4 = ssta.sel(time=34)
 
 ##############################################################################
 # Plot with default spacing:
@@ -181,8 +199,9 @@ grid = fig.add_gridspec(ncols=2, nrows=2)
 
 title = "Default spacing between plots"
 
-# Create the figure with the given title and gridspec
-create_fig(grid, fig, title)
+# Create the figure with the given title and gridspec, keeping its contour sets
+# to draw the same panels in the figures below
+contour_sets = create_fig(grid, fig, title)
 
 ##############################################################################
 # Plot with reduced spacing between the left and right subplots
@@ -195,7 +214,7 @@ grid = fig.add_gridspec(ncols=2, nrows=2, wspace=0.125)
 
 title = "Reduced spacing between left and right plots"
 
-create_fig(grid, fig, title)
+create_fig(grid, fig, title, contour_sets)
 
 ##############################################################################
 # Plot with reduced spacing between the top and bottom subplots
@@ -208,4 +227,4 @@ grid = fig.add_gridspec(ncols=2, nrows=2, wspace=0.125, hspace=-0.15)
 
 title = "Reduced spacing between top and bottom plots"
 
-create_fig(grid, fig, title)
+create_fig(grid, fig, title, contour_sets)
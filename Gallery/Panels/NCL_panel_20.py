@@ -31,13 +31,11 @@ import geocat.viz as gv
 # Open a netCDF data file using xarray default engine and load the data into xarrays
 ds = xr.open_dataset(gdf.get("netcdf_files/uv300.nc"))
 
-# Extract data from second timestep
-time_0 = ds.isel(time=0, drop=True)
-time_1 = ds.isel(time=1, drop=True)
-
-# Ensure longitudes range from 0 to 360 degrees
-U_0 = gv.xr_add_cyclic_longitudes(time_0.U, "lon")
-U_1 = gv.xr_add_cyclic_longitudes(time_1.U, "lon")
+# Extract U from the first two timesteps and ensure longitudes range from 0
+# to 360 degrees, adding the cyclic longitude once for both timesteps
+U = gv.xr_add_cyclic_longitudes(ds.U.isel(time=[0, 1]), "lon")
+U_0 = U.isel(time=0, drop=True)
+U_1 = U.isel(time=1, drop=True)
 
 ###############################################################################
 # Create helper functions:
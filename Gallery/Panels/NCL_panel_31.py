@@ -5,7 +5,9 @@ This script illustrates the following concepts:
    - Paneling 8 plots on a page
    - Adding a common title to paneled plots
    - Overlaying an image onto a map
+   - Cropping an image to the region of the map before drawing it
    - Adding a vector field to a map
+   - Thinning vectors to a minimum distance on the screen
 
 See following URLs to see the reproduced NCL plot & script:
     - Original NCL script: https://www.ncl.ucar.edu/Applications/Scripts/panel_31.ncl
@@ -41,6 +43,74 @@ V = ds.V
 lat = ds.lat
 lon = ds.lon
 
+###############################################################################
+# Utility functions:
+
+# Cache of the vector selections computed by thin_vectors
+thin_cache = {}
+
+
+# Select the grid points to draw vectors at. The grid points are transformed
+# to display (pixel) coordinates and binned into square cells of
+# `min_distance` pixels, keeping the first point in each cell. The number of
+# vectors is then bounded by the size of the axes rather than the size of the
+# grid, and points more than `min_distance` outside of the axes (whose arrows
+# could not reach into the map) are dropped entirely.
+# The selection only depends on the projection, map extent, axes size and the
+# grid coordinates, so it is cached and reused by every panel with the same
+# layout and grid.
+def thin_vectors(ax, lon, lat, min_distance):
+    x0, y0, width, height = ax.bbox.bounds
+    key = (ax.projection, tuple(ax.get_extent()), round(width), round(height))
+    key += (tuple(lon.values), tuple(lat.values), min_distance)
+    if key not in thin_cache:
+        lon2d, lat2d = np.meshgrid(lon, lat)
+        xyz = ax.projection.transform_points(ccrs.PlateCarree(), lon2d, lat2d)
+        display = ax.transData.transform(xyz[..., :2].reshape(-1, 2))
+        display -= (x0 - min_distance, y0 - min_distance)
+        size = (width + 2 * min_distance, height + 2 * min_distance)
+        inside = np.all((display >= 0) & (display <= size), axis=1)
+        cell = (display // min_distance).astype(int)
+        cell_id = cell[:, 1] * (int(size[0] // min_distance) + 1) + cell[:, 0]
+        cell_id = np.where(inside, cell_id, -1)
+        _, first = np.unique(cell_id, return_index=True)
+        first = first[cell_id[first] >= 0]
+        thin_cache[key] = np.unravel_index(first, lon2d.shape)
+    return thin_cache[key]
+
+
+# Crop a global image in the PlateCarree projection, with the given extent, to
+# the region of a map (plus a `halo` of pixels on each side), and return the
+# cropped image together with its own extent. Only the region shown on the map
+# then has to be resampled when the map is drawn. If the region has more
+# pixels than the axes it is drawn in, every `step`-th pixel is kept, so that
+# the cropped image is no larger than needed for the axes.
+def crop_image(img, img_extent, map_extent, axes_size, halo=1):
+    img_west, img_east, img_south, img_north = img_extent
+    west, east, south, north = map_extent
+    nrows, ncols = img.shape[:2]
+    dx = (img_east - img_west) / ncols
+    dy = (img_north - img_south) / nrows
+
+    # Columns from west to east and rows from north to south, as the origin of
+    # the image is in the upper left corner
+    col0 = max(int(np.floor((west - img_west) / dx)) - halo, 0)
+    col1 = min(int(np.ceil((east - img_west) / dx)) + halo, ncols)
+    row0 = max(int(np.floor((img_north - north) / dy)) - halo, 0)
+    row1 = min(int(np.ceil((img_north - south) / dy)) + halo, nrows)
+
+    step = max(int(min((col1 - col0) / axes_size[0], (row1 - row0) / axes_size[1])), 1)
+    cropped = img[row0:row1:step, col0:col1:step]
+
+    cropped_extent = (
+        img_west + col0 * dx,
+        img_west + (col0 + cropped.shape[1] * step) * dx,
+        img_north - (row0 + cropped.shape[0] * step) * dy,
+        img_north - row0 * dy,
+    )
+    return cropped, cropped_extent
+
+
 ###############################################################################
 # Plot:
 
@@ -56,6 +126,16 @@ pressure = np.reshape(levs, (4, 2))
 # Define image extent. This image is of the entire globe, so extent covers all latitudes and longitudes
 img_extent = (-180, 180, -90, 90)
 
+# Define the extent of the maps
+map_extent = [65, 95, 5, 25]
+
+# All the maps show the same region at the same size, so the image is cropped
+# to that region once and the cropped image is shared by every panel
+axs[0][0].set_extent(map_extent)
+map_img, map_img_extent = crop_image(
+    img, img_extent, map_extent, axes_size=axs[0][0].bbox.size
+)
+
 # Loop through each axes and plot
 # Loop through each row
 for i in range(4):
@@ -65,18 +145,23 @@ for i in range(4):
         ax = axs[i][j]
 
         # Set extent of the map
-        ax.set_extent([65, 95, 5, 25])
+        ax.set_extent(map_extent)
 
         # add the image. The "origin" of the image is in the upper left corner
-        ax.imshow(img, origin='upper', extent=img_extent, transform=ccrs.PlateCarree())
+        ax.imshow(
+            map_img, origin='upper', extent=map_img_extent, transform=ccrs.PlateCarree()
+        )
         ax.coastlines(resolution='50m', color='black', linewidth=1)
 
+        # Select the vectors to draw, roughly 20 pixels apart
+        ilat, ilon = thin_vectors(ax, lon, lat, min_distance=20)
+
         # Add vectors onto the plot
         Q = ax.quiver(
-            lon,
-            lat,
-            U.sel(lev=pressure[i][j]),
-            V.sel(lev=pressure[i][j]),
+            lon.data[ilon],
+            lat.data[ilat],
+            U.sel(lev=pressure[i][j]).data[ilat, ilon],
+            V.sel(lev=pressure[i][j]).data[ilat, ilon],
             color='white',
             pivot='middle',
             width=0.0025,
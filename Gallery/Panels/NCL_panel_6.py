@@ -38,18 +38,22 @@ import geocat.viz as gv
 # Open a netCDF data file using xarray default engine and load the data into xarrays
 ds = xr.open_dataset(gdf.get("netcdf_files/h_avg_Y0191_D000.00.nc"), decode_times=False)
 
-data0 = ds.T.isel(time=0, drop=True).isel(z_t=0, drop=True)
-data1 = ds.T.isel(time=0, drop=True).isel(z_t=5, drop=True)
-data2 = ds.S.isel(time=0, drop=True).isel(z_t=0, drop=True)
-data3 = ds.S.isel(time=0, drop=True).isel(z_t=3, drop=True)
+# Add the cyclic longitude once per variable, for both of its plotted depth
+# levels; the individual panels are views into the wrapped arrays
+T = gv.xr_add_cyclic_longitudes(ds.T.isel(time=0, z_t=[0, 5], drop=True), "lon_t")
+S = gv.xr_add_cyclic_longitudes(ds.S.isel(time=0, z_t=[0, 3], drop=True), "lon_t")
 
-data0 = gv.xr_add_cyclic_longitudes(data0, "lon_t")
-data1 = gv.xr_add_cyclic_longitudes(data1, "lon_t")
-data2 = gv.xr_add_cyclic_longitudes(data2, "lon_t")
-data3 = gv.xr_add_cyclic_longitudes(data3, "lon_t")
+data0 = T.isel(z_t=0, drop=True)
+data1 = T.isel(z_t=1, drop=True)
+data2 = S.isel(z_t=0, drop=True)
+data3 = S.isel(z_t=1, drop=True)
 
 data = [[data0, data1], [data2, data3]]
 
+# Contour levels of each panel, shared by its filled contours and contour
+# lines. An integer lets matplotlib choose about that many levels from the data
+levels = [[np.arange(-2, 34, 2), np.arange(-4, 30, 2)], [15, 12]]
+
 ###############################################################################
 # Plot without extra whitespace:
 projection = ccrs.NorthPolarStereo()
@@ -144,76 +148,28 @@ cmap = "magma"
 
 # Plot filled contours
 contour = np.empty((2, 2), dtype=mcontour.ContourSet)
-contour[0][0] = data[0][0].plot.contourf(
-    ax=axs[0][0],
-    cmap=cmap,
-    levels=np.arange(-2, 34, 2),
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[0][1] = data[0][1].plot.contourf(
-    ax=axs[0][1],
-    cmap=cmap,
-    levels=np.arange(-4, 30, 2),
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[1][0] = data[1][0].plot.contourf(
-    ax=axs[1][0],
-    cmap=cmap,
-    levels=15,
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[1][1] = data[1][1].plot.contourf(
-    ax=axs[1][1],
-    cmap=cmap,
-    levels=12,
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
+for row in range(2):
+    for col in range(2):
+        contour[row][col] = data[row][col].plot.contourf(
+            ax=axs[row][col],
+            cmap=cmap,
+            levels=levels[row][col],
+            transform=ccrs.PlateCarree(),
+            add_colorbar=False,
+            zorder=0,
+        )
 
-# Plot contour lines
-data[0][0].plot.contour(
-    ax=axs[0][0],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=np.arange(-2, 34, 2),
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[0][1].plot.contour(
-    ax=axs[0][1],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=np.arange(-4, 30, 2),
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[1][0].plot.contour(
-    ax=axs[1][0],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=15,
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[1][1].plot.contour(
-    ax=axs[1][1],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=12,
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
+        # Plot contour lines from the filled contour set, which reuses its
+        # levels and contour generator instead of setting them up again from
+        # the data
+        axs[row][col].contour(
+            contour[row][col],
+            colors='black',
+            linestyles='solid',
+            linewidths=0.5,
+            transform=ccrs.PlateCarree(),
+            zorder=1,
+        )
 
 # Create colorbars and reduce the font size
 for row in range(0, 2):
@@ -248,7 +204,8 @@ fig, axs = plt.subplots(
     subplot_kw=dict(projection=projection),
 )
 #
-# Everything beyond this is the same code for the example without extra white space
+# Everything beyond this is the same code for the example without extra white
+# space, except that the contours are drawn from the contour sets computed there
 #
 
 # Format axes and inset axes for color bars
@@ -335,81 +292,28 @@ for row in range(0, 2):
             bbox_transform=axs[row][col].transAxes,
             borderpad=0,
         )
-# Import color map
-cmap = "magma"
-
-# Plot filled contours
+# Plot filled contours and contour lines from the filled contour sets of the
+# previous figure, since the fields and their levels are the same
+filled_contour = contour
 contour = np.empty((2, 2), dtype=mcontour.ContourSet)
-contour[0][0] = data[0][0].plot.contourf(
-    ax=axs[0][0],
-    cmap=cmap,
-    levels=np.arange(-2, 34, 2),
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[0][1] = data[0][1].plot.contourf(
-    ax=axs[0][1],
-    cmap=cmap,
-    levels=np.arange(-4, 30, 2),
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[1][0] = data[1][0].plot.contourf(
-    ax=axs[1][0],
-    cmap=cmap,
-    levels=15,
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-contour[1][1] = data[1][1].plot.contourf(
-    ax=axs[1][1],
-    cmap=cmap,
-    levels=12,
-    transform=ccrs.PlateCarree(),
-    add_colorbar=False,
-    zorder=0,
-)
-
-# Plot contour lines
-data[0][0].plot.contour(
-    ax=axs[0][0],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=np.arange(-2, 34, 2),
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[0][1].plot.contour(
-    ax=axs[0][1],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=np.arange(-4, 30, 2),
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[1][0].plot.contour(
-    ax=axs[1][0],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=15,
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
-data[1][1].plot.contour(
-    ax=axs[1][1],
-    colors='black',
-    linestyles='solid',
-    linewidths=0.5,
-    levels=12,
-    transform=ccrs.PlateCarree(),
-    zorder=1,
-)
+for row in range(2):
+    for col in range(2):
+        contour[row][col] = axs[row][col].contourf(
+            filled_contour[row][col],
+            cmap=filled_contour[row][col].cmap,
+            norm=filled_contour[row][col].norm,
+            extend=filled_contour[row][col].extend,
+            transform=ccrs.PlateCarree(),
+            zorder=0,
+        )
+        axs[row][col].contour(
+            contour[row][col],
+            colors='black',
+            linestyles='solid',
+            linewidths=0.5,
+            transform=ccrs.PlateCarree(),
+            zorder=1,
+        )
 
 # Create colorbars and reduce the font size
 for row in range(0, 2):
@@ -37,6 +37,40 @@ xyarr = ds.nao_pc_djf
 # Fix the artifact of not-shown-data around -0 and 360 degree longitudes
 deppat = gv.xr_add_cyclic_longitudes(deppat, 'lon')
 
+###############################################################################
+# Utility function:
+
+
+# Calculate a weighted running average along dimension `dim`. The result is
+# accumulated one weight at a time from shifted slices of the data, so no copy
+# of the data is made for every position in the window. Like xarray's centered
+# rolling windows, the points where the window does not fit are set to NaN
+# (all of them if the data is shorter than the window).
+def weighted_running_mean(da, weights, dim):
+    weights = np.asarray(weights)
+    nweights = weights.size
+
+    def running_mean(x):
+        n = x.shape[-1]
+        out = np.full(x.shape, np.nan)
+        if n < nweights:
+            return out
+        valid = out[..., nweights // 2 : n - (nweights - 1) // 2]
+        valid[...] = 0
+        for k, w in enumerate(weights):
+            valid += w * x[..., k : n - nweights + 1 + k]
+        return out
+
+    return xr.apply_ufunc(
+        running_mean,
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[[dim]],
+        dask='parallelized',
+        output_dtypes=[float],
+    ).transpose(*da.dims)
+
+
 ###############################################################################
 # Plot
 
@@ -122,12 +156,10 @@ ax2.fill_between(x, y, where=y < 0, color='blue', interpolate=True)
 ax2.axhline(y=0, color='black', linewidth=0.5)
 
 # Array with weights for rolling average
-weight = xr.DataArray(
-    [1 / 24, 3 / 24, 5 / 24, 6 / 24, 5 / 24, 3 / 24, 1 / 24], dims=['window']
-)
+weight = [1 / 24, 3 / 24, 5 / 24, 6 / 24, 5 / 24, 3 / 24, 1 / 24]
 
-# Calculating the dot product of rolling average and weights
-roll_avg = xyarr.rolling(time=7, center=True).construct('window').dot(weight)
+# Calculating the weighted rolling average
+roll_avg = weighted_running_mean(xyarr, weight, 'time')
 
 # Plot rolling average
 ax2.plot(xyarr.time, roll_avg, color='black', linewidth=1)
@@ -83,32 +83,37 @@ gv.set_titles_and_labels(
     maintitle="Dummy station data colored and\nsized according to range of values",
 )
 
-# Plot markers with values less than first bin value
-masked_lon = np.where(r < bins[0], lon, np.nan)
-masked_lat = np.where(r < bins[0], lat, np.nan)
-label = "x < " + str(bins[0])
-plt.scatter(masked_lon, masked_lat, label=label, s=sizes[0], color=colors[0], zorder=1)
-
-# Plot all other markers but those in the last bin
-label_format = "{} <= x < {}"
-for x in range(1, len(bins)):
-    masked_lon = np.where(bins[x - 1] <= r, lon, np.nan)
-    masked_lon = np.where(r < bins[x], masked_lon, np.nan)
-    masked_lat = np.where(bins[x - 1] <= r, lat, np.nan)
-    masked_lat = np.where(r < bins[x], masked_lat, np.nan)
-    label = label_format.format(bins[x - 1], bins[x])
+# Find the bin of every marker at once. np.digitize returns 0 for values less
+# than the first bin value, len(bins) for values greater than or equal to the
+# last bin value, and i for bins[i - 1] <= x < bins[i]
+bin_index = np.digitize(r, bins)
+
+# Sort the markers by bin so that each bin is a contiguous slice of the
+# sorted arrays, and find where each bin starts and ends
+order = np.argsort(bin_index, kind='stable')
+bin_edges = np.searchsorted(bin_index[order], np.arange(len(bins) + 2))
+sorted_lon = lon[order]
+sorted_lat = lat[order]
+
+# Labels for the legend
+labels = (
+    ["x < " + str(bins[0])]
+    + ["{} <= x < {}".format(bins[x - 1], bins[x]) for x in range(1, len(bins))]
+    + ["x >= " + str(bins[-1])]
+)
+
+# Plot the markers of each bin, the last bin reuses the largest marker size
+for x, label in enumerate(labels):
+    start, end = bin_edges[x], bin_edges[x + 1]
     plt.scatter(
-        masked_lon, masked_lat, label=label, s=sizes[x], color=colors[x], zorder=1
+        sorted_lon[start:end],
+        sorted_lat[start:end],
+        label=label,
+        s=sizes[min(x, len(sizes) - 1)],
+        color=colors[x],
+        zorder=1,
     )
 
-# Plot markers with values greater than or equal to last bin value
-masked_lon = np.where(r >= bins[-1], lon, np.nan)
-masked_lat = np.where(r >= bins[-1], lat, np.nan)
-label = "x >= " + str(bins[-1])
-plt.scatter(
-    masked_lon, masked_lat, label=label, s=sizes[-1], color=colors[-1], zorder=1
-)
-
 # `ncol` being equal to half of the number of labels makes the legend appear
 # horizontal with two rows
 legend = ax.legend(
@@ -90,23 +90,24 @@ gv.set_titles_and_labels(
     maintitle="Dummy station data colored and\nsized according to range of values",
 )
 
-# Plot markers with values less than first bin value
-masked_lon = np.where(r < bins[0], lon, np.nan)
-masked_lat = np.where(r < bins[0], lat, np.nan)
-plt.scatter(masked_lon, masked_lat, s=sizes[0], color=marker_colors[0], zorder=1)
-
-# Plot all other markers but those in the last bin
-for x in range(1, len(bins)):
-    masked_lon = np.where(bins[x - 1] <= r, lon, np.nan)
-    masked_lon = np.where(r < bins[x], masked_lon, np.nan)
-    masked_lat = np.where(bins[x - 1] <= r, lat, np.nan)
-    masked_lat = np.where(r < bins[x], masked_lat, np.nan)
-    plt.scatter(masked_lon, masked_lat, s=sizes[x], color=marker_colors[x], zorder=1)
-
-# Plot markers with values greater than or equal to last bin value
-masked_lon = np.where(r >= bins[-1], lon, np.nan)
-masked_lat = np.where(r >= bins[-1], lat, np.nan)
-plt.scatter(masked_lon, masked_lat, s=sizes[-1], color=marker_colors[-1], zorder=1)
+# Find the bin of every marker at once. np.digitize returns 0 for values less
+# than the first bin value, len(bins) for values greater than or equal to the
+# last bin value, and i for bins[i - 1] <= x < bins[i]
+bin_index = np.digitize(r, bins)
+
+# Values beyond the last bin use the last color and size
+style_index = np.where(bin_index == len(bins), len(boundaries) - 1, bin_index)
+
+# Sort the markers by bin so that markers of larger bins are drawn on top,
+# and plot all of them at once with per-marker colors and sizes
+order = np.argsort(bin_index, kind='stable')
+plt.scatter(
+    lon[order],
+    lat[order],
+    s=sizes[style_index[order]],
+    color=marker_colors[style_index[order]],
+    zorder=1,
+)
 
 # Create colorbar
 plt.colorbar(
@@ -5,6 +5,7 @@ NCL_pdf_1.py
 This script illustrates the following concepts:
    - Generating univariate probability distributions
    - Generating PDFs of each sample distribution
+   - Accumulating the histogram of a sample one chunk at a time
    - Paneling two plots horizontally on a page
    - Modifying tick placement with matplotlib.ticker
 
@@ -23,6 +24,39 @@ from scipy import stats
 
 import geocat.viz as gv
 
+###############################################################################
+# Utility function:
+
+
+# Calculate the PDF (in percent) of a sample by accumulating its histogram one
+# chunk of `chunk_size` entries along the first axis at a time. Only the bin
+# counts are kept between chunks, so the sample (which may also be a lazily
+# loaded xarray or dask array) never has to be in memory all at once, and the
+# counts of separate chunks can simply be added together. If `bins` is a
+# number of bins, a first pass over the chunks finds the range of the data,
+# which gives the same bins as np.histogram.
+def chunked_pdf(data, bins, chunk_size=16):
+    def chunks():
+        for start in range(0, len(data), chunk_size):
+            yield np.asarray(data[start : start + chunk_size])
+
+    if np.ndim(bins) == 0:
+        low, high = np.inf, -np.inf
+        for chunk in chunks():
+            low = min(low, chunk.min())
+            high = max(high, chunk.max())
+        bins = np.linspace(low, high, bins + 1)
+
+    counts = np.zeros(len(bins) - 1, dtype=int)
+    total = 0
+    for chunk in chunks():
+        counts += np.histogram(chunk, bins=bins)[0]
+        total += chunk.size
+
+    bincenters = 0.5 * (bins[1:] + bins[:-1])
+    return bincenters, counts / total * 100
+
+
 ###############################################################################
 # Generate univariate probability distributions:
 
@@ -30,23 +64,17 @@ import geocat.viz as gv
 mu = 0
 sigma = 50
 normalpdf = stats.norm.rvs(mu, sigma, size=(64, 128))
-normalhist, normalbins = np.histogram(normalpdf, bins=np.linspace(-200, 200, 25))
-normalhist = normalhist / (64 * 128) * 100
-normalbincenters = 0.5 * (normalbins[1:] + normalbins[:-1])
+normalbincenters, normalhist = chunked_pdf(normalpdf, bins=np.linspace(-200, 200, 25))
 
 # Chi-squared distribution
 df = 2
 chipdf = stats.chi2.rvs(df, size=1000)
-chihist, chibins = np.histogram(chipdf, bins=25)
-chihist = chihist / 1000 * 100
-chibincenters = 0.5 * (chibins[1:] + chibins[:-1])
+chibincenters, chihist = chunked_pdf(chipdf, bins=25, chunk_size=250)
 
 # Gamma distribution
 a = 2
 gammapdf = stats.gamma.rvs(a, size=(50, 100))
-gammahist, gammabins = np.histogram(gammapdf, bins=25)
-gammahist = gammahist / (50 * 100) * 100
-gammabincenters = 0.5 * (gammabins[1:] + gammabins[:-1])
+gammabincenters, gammahist = chunked_pdf(gammapdf, bins=25)
 
 ###############################################################################
 # Plot:
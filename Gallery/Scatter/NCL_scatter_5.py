@@ -61,16 +61,15 @@ numBins = 8
 indices = np.arange(0, 300)
 partitions = np.linspace(0, 20, numBins + 1)
 label = "{start:g}:{end:g}"
+
+# Find the bin of every data point at once; points outside of the
+# partitions get a bin index of -1 or numBins and are not plotted
+bin_index = np.digitize(data, partitions) - 1
 for x in range(0, numBins):
-    bins = np.where(data > partitions[x], data, np.nan)
-    with np.errstate(
-        invalid='ignore'
-    ):  # Indeed not needed, just to get rid of warnings about numpy's NaN comparisons
-        bins = np.where(bins < partitions[x + 1], bins, np.nan)
-    indices = np.where(bins != np.nan, indices, np.nan)
+    in_bin = bin_index == x
     plt.plot(
-        indices,
-        bins,
+        indices[in_bin],
+        data[in_bin],
         marker=markers[x],
         fillstyle='none',
         linewidth=0,
@@ -57,20 +57,22 @@ colors = (
 # Create array of marker sizes
 bins = np.linspace(100, 2000, 10)
 
-# Plot all points
+# Assign each point to one of the 10 color/size categories
+category = np.arange(numpoints) % 10
+
+# Plot all points with a single call, passing per-point colors and sizes
 # longitude points must be transformed from degrees to radians
 # to be plotted on polar projection
-for x in range(numpoints):
-    ax.scatter(
-        (np.pi / 180.0) * lon[x],
-        lat[x],
-        color=colors[x % 10],
-        s=bins[x % 10],
-        edgecolors='black',
-        linewidths=1,
-        alpha=0.9,
-        zorder=2,
-    )
+ax.scatter(
+    np.deg2rad(lon),
+    lat,
+    color=np.array(colors)[category],
+    s=bins[category],
+    edgecolors='black',
+    linewidths=1,
+    alpha=0.9,
+    zorder=2,
+)
 
 # set the labels and locations of the angular gridlines
 linelabels = (
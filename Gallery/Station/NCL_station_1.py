@@ -4,6 +4,8 @@ NCL_station_1.py
 This script illustrates the following concepts:
    - Using pandas package to read in ascii file with several columns of data
    - Using tricontour and tricontourf function from matplotlib package to contour one-dimensional X, Y, Z data
+   - Reusing a single triangulation of the station locations for several contour calls
+   - Masking long, skinny triangles along the edge of a triangulation
    - Drawing lat/lon locations as filled dots
    - Controlling which contour lines get drawn
    - Using alpha parameter to emphasize or subdue overlain features
@@ -22,6 +24,7 @@ import pandas as pd
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from matplotlib import pyplot as plt
+from matplotlib.tri import Triangulation, TriAnalyzer
 
 import geocat.datafiles as gdf
 import geocat.viz as gv
@@ -37,6 +40,18 @@ pwv = ds.PW
 pwv_lat1d = ds.LAT
 pwv_lon1d = ds.LON
 
+###################################################
+# Triangulate the station locations:
+
+# Build the Delaunay triangulation of the stations once. Passing it to both
+# tricontour and tricontourf below (and to any other variable or time step
+# observed by the same stations) avoids re-triangulating for every call.
+triang = Triangulation(pwv_lon1d, pwv_lat1d)
+
+# Mask the long, skinny triangles that Delaunay triangulation creates along
+# the convex hull of the stations, since they produce contouring artifacts
+triang.set_mask(TriAnalyzer(triang).get_flat_tri_mask(min_circle_ratio=0.01))
+
 ###################################################
 # Plot
 
@@ -52,7 +67,7 @@ flevels = np.arange(16, 51, 1)
 
 # Plot contour lines
 contour = ax.tricontour(
-    pwv_lon1d, pwv_lat1d, pwv, levels=clevels, colors='black', linewidths=0.6, zorder=4
+    triang, pwv, levels=clevels, colors='black', linewidths=0.6, zorder=4
 )
 
 # Label the contours and set axes title
@@ -60,8 +75,7 @@ ax.clabel(contour, clevels, fontsize=25, fmt="%.0f")
 
 # Plot filled contours
 color = ax.tricontourf(
-    pwv_lon1d,
-    pwv_lat1d,
+    triang,
     pwv,
     cmap='magma',
     alpha=0.85,
@@ -112,15 +112,12 @@ scatter1, ax = make_shared_plot(
 )
 
 # Add a legend to the bottom outside of the plot
-# Given how we generated the plot, adding a legend is a little kludgy. Basically, we draw a second plot where no data
-# is in frame but the legend for that plot is drawn where we want it
+# The legend entries are built directly from the bin bounds and colors, and
+# drawn on an empty axes placed below the map
 lax = plt.axes((0, 0, 1, 0.1), frameon=False)
-
-# Plotting window is [0,1] x [0,1]
-plt.xlim(0, 1)
-plt.ylim(0, 1)
 plt.axis('off')
 
+handles = []
 for n, color in enumerate(colors):
     if n == 0:
         label = f'x < {bin_bounds[0]:.0f}'
@@ -129,12 +126,12 @@ for n, color in enumerate(colors):
     else:
         label = f'{bin_bounds[n - 1]:.0f} <= x < {bin_bounds[n]:.0f}'
 
-    # Plotting data at (-10, -10) which is not in the plotting window
-    scatter = plt.scatter(-10, -10, color=color, label=label)
+    handles.append(
+        mpl.lines.Line2D([], [], color=color, marker='o', linewidth=0, label=label)
+    )
 
-# The legend for this second plot is what we are actually interested in
 # We want large font, no frame around the legend, and 4 columns of labels
-lax.legend(loc='center', fontsize='large', frameon=False, ncol=4)
+lax.legend(handles=handles, loc='center', fontsize='large', frameon=False, ncol=4)
 
 plt.show()
 
@@ -0,0 +1,208 @@
+"""
+Station_gridding.py
+===================
+This script illustrates the following concepts:
+   - Using pandas package to read in ascii file with several columns of data
+   - Gridding irregularly spaced station data with an objective analysis
+   - Comparing Cressman, Barnes and inverse-distance weighting schemes
+   - Finding the stations near each grid point with a KD-tree
+   - Drawing filled contours of the gridded data with contourf
+
+Contouring station data directly with ``tricontourf`` (see
+`NCL_station_1.py <https://geocat-examples.readthedocs.io/en/latest/gallery/Station/NCL_station_1.html>`_)
+gets slow for large networks and shows the shape of the underlying
+triangulation. An objective analysis instead estimates the field at each
+point of a regular grid as a distance-weighted average of the nearby
+stations, after which the usual ``contourf`` can be used.
+
+The neighbors of every grid point and their weights only depend on the
+station locations, so they are computed separately from the station values
+and applied to them with a single vectorized weighted sum.
+"""
+
+###############################################################################
+# Import packages:
+
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+import geocat.datafiles as gdf
+import geocat.viz as gv
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from scipy.spatial import cKDTree
+
+###############################################################################
+# Read in data:
+
+# Open a ascii data file using pandas' read_csv function
+ds = pd.read_csv(gdf.get('ascii_files/pw.dat'), delimiter='\\s+')
+
+# Extract columns
+pwv = ds.PW.values
+pwv_lat1d = ds.LAT.values
+pwv_lon1d = ds.LON.values
+
+###############################################################################
+# Define the analysis grid:
+
+# Regular 0.1 degree grid covering the stations
+grid_lon = np.arange(pwv_lon1d.min() - 0.5, pwv_lon1d.max() + 0.5, 0.1)
+grid_lat = np.arange(pwv_lat1d.min() - 0.5, pwv_lat1d.max() + 0.5, 0.1)
+grid_lon2d, grid_lat2d = np.meshgrid(grid_lon, grid_lat)
+
+###############################################################################
+# Utility functions:
+
+
+# Distances are computed in a local Cartesian plane (in degrees of latitude),
+# shrinking longitudes by the cosine of the mean station latitude
+def to_xy(lon, lat, lat0):
+    return np.column_stack([np.ravel(lon) * np.cos(np.deg2rad(lat0)), np.ravel(lat)])
+
+
+# Compute the station indices and normalized weights for every grid point.
+# `radius` is the radius of influence in degrees of latitude, and at most `k`
+# stations within that radius are used for each grid point.
+def analysis_weights(
+    station_lon, station_lat, grid_lon, grid_lat, radius, method='cressman', k=16
+):
+    lat0 = np.mean(station_lat)
+    tree = cKDTree(to_xy(station_lon, station_lat, lat0))
+
+    # Query the k nearest stations of all grid points at once. Missing
+    # neighbors (fewer than k stations within the radius) have an infinite
+    # distance and an index equal to the number of stations.
+    k = min(k, len(station_lon))
+    points = to_xy(grid_lon, grid_lat, lat0)
+    dist, idx = tree.query(points, k=k, distance_upper_bound=radius)
+
+    # Keep one row of neighbors per grid point, also for k == 1 where the
+    # query returns 1D arrays
+    dist = dist.reshape(len(points), k)
+    idx = idx.reshape(len(points), k)
+    found = np.isfinite(dist)
+    dist = np.where(found, dist, radius)
+    idx = np.where(found, idx, 0)
+
+    if method == 'cressman':
+        weights = (radius**2 - dist**2) / (radius**2 + dist**2)
+    elif method == 'barnes':
+        # Smoothing parameter chosen so that the weight falls to ~1% at radius
+        kappa = (radius / 2.15) ** 2
+        weights = np.exp(-(dist**2) / kappa)
+    elif method == 'idw':
+        # A station located on a grid point gets (almost) all of the weight
+        weights = 1.0 / np.maximum(dist, 1e-6) ** 2
+    else:
+        raise ValueError(f"Unknown objective analysis method: {method}")
+
+    weights = np.where(found, weights, 0.0)
+
+    # Normalize the weights; grid points without any station nearby are
+    # marked with NaN weights so that they end up missing in the analysis
+    total = weights.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weights = np.where(total > 0, weights / total, np.nan)
+
+    return idx, weights
+
+
+# Apply precomputed weights to station values. Any leading dimensions of
+# `values` (e.g. time) are carried through, so many fields observed by the
+# same stations are gridded with one weighted sum.
+def apply_weights(values, idx, weights, grid_shape):
+    values = np.asarray(values)
+    gridded = np.einsum('...gk,gk->...g', values[..., idx], weights)
+    return gridded.reshape(values.shape[:-1] + grid_shape)
+
+
+###############################################################################
+# Grid the station data:
+
+# Radius of influence in degrees of latitude
+radius = 1.5
+
+methods = {
+    'cressman': 'Cressman',
+    'barnes': 'Barnes',
+    'idw': 'Inverse distance',
+}
+
+gridded = {}
+for method in methods:
+    idx, weights = analysis_weights(
+        pwv_lon1d, pwv_lat1d, grid_lon2d, grid_lat2d, radius, method=method
+    )
+    gridded[method] = apply_weights(pwv, idx, weights, grid_lon2d.shape)
+
+###############################################################################
+# Plot:
+
+# Generate figure (set its size (width, height) in inches)
+fig, axs = plt.subplots(
+    1,
+    3,
+    figsize=(18, 6.5),
+    subplot_kw={"projection": ccrs.PlateCarree()},
+    constrained_layout=True,
+)
+
+# Specify contourf levels
+flevels = np.arange(16, 51, 1)
+
+for ax, (method, title) in zip(axs, methods.items()):
+    # Plot filled contours of the gridded data
+    color = ax.contourf(
+        grid_lon,
+        grid_lat,
+        gridded[method],
+        cmap='magma',
+        levels=flevels,
+        extend='both',
+        zorder=3,
+    )
+
+    # Add coordinate markers on the plot
+    ax.plot(
+        pwv_lon1d,
+        pwv_lat1d,
+        marker='o',
+        markersize=3,
+        linewidth=0,
+        color='black',
+        zorder=4,
+    )
+
+    # Add state boundaries
+    ax.add_feature(cfeature.STATES, edgecolor='gray', linestyle=(0, (5, 10)), zorder=4)
+
+    # Use geocat.viz.util convenience function to set axes tick values
+    gv.set_axes_limits_and_ticks(
+        ax,
+        xlim=(grid_lon[0], grid_lon[-1]),
+        ylim=(grid_lat[0], grid_lat[-1]),
+        xticks=np.arange(-101, -93, 2),
+        yticks=np.array([34, 36, 38, 40]),
+    )
+
+    # Use geocat.viz.util convenience function to set latitude, longitude tick labels
+    gv.add_lat_lon_ticklabels(ax)
+
+    # Use geocat.viz.util convenience function to add minor and major tick lines
+    gv.add_major_minor_ticks(ax, x_minor_per_major=2, y_minor_per_major=1, labelsize=12)
+
+    # Add title
+    ax.set_title(title, fontsize=16)
+
+# Add a shared colorbar
+cab = fig.colorbar(
+    color, ax=axs, orientation='horizontal', shrink=0.6, ticks=flevels[::4]
+)
+cab.ax.xaxis.set_tick_params(length=0, labelsize=12)
+
+# Add a main title
+fig.suptitle('GPS PWV(18Z) gridded with an objective analysis', fontsize=20)
+
+# Show the plot
+plt.show()
@@ -0,0 +1,225 @@
+"""
+Streamline_integration.py
+=========================
+This script illustrates the following concepts:
+   - Integrating streamlines from many seed points at once with NumPy
+   - Caching the integrated streamlines to disk
+   - Drawing streamlines as a LineCollection
+   - Drawing the same streamlines in two different styles
+
+Matplotlib's ``streamplot`` integrates every streamline in pure Python each
+time it is called, so drawing the same wind field in several panels or
+styles repeats the integration. Here the streamlines are integrated once
+with a fourth-order Runge-Kutta scheme that advances all seed points
+together, stored as plain arrays, and cached in a ``.npz`` file. Every plot
+afterwards (and every later run of the script) only has to draw them.
+
+The streamlines are integrated with a fixed step along the direction of the
+wind, in degrees of arc, so their length does not depend on the wind speed.
+"""
+
+################################################################################
+# Import packages:
+
+import hashlib
+import os
+import tempfile
+
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+import geocat.datafiles as gdf
+import geocat.viz as gv
+import matplotlib.pyplot as plt
+import numpy as np
+import xarray as xr
+from matplotlib.collections import LineCollection
+from scipy.interpolate import RegularGridInterpolator
+
+################################################################################
+# Read in data:
+
+# Open a netCDF data file using xarray default engine and load the data into xarrays
+ds = xr.open_dataset(gdf.get('netcdf_files/uvt.nc'))
+# Extract a 2D horizontal slice from the first time step of the 3D U and V variables at the bottom level
+U = ds.U.isel(time=0, lev=0)
+V = ds.V.isel(time=0, lev=0)
+
+# Close the seam at 0/360 degrees so that streamlines can cross it
+U = gv.xr_add_cyclic_longitudes(U, 'lon')
+V = gv.xr_add_cyclic_longitudes(V, 'lon')
+
+################################################################################
+# Utility functions:
+
+
+# Wrap longitudes into the range of the longitude coordinate
+def wrap_lon(lon, lon_coord):
+    lon_min = lon_coord.data[0]
+    return (lon - lon_min) % 360 + lon_min
+
+
+# Integrate streamlines from all seed points at once. The positions of every
+# seed are advanced together with a fourth-order Runge-Kutta step, so the only
+# Python loop is over the number of steps. Streamlines that leave the grid
+# (or reach a point of zero wind) are set to NaN from then on.
+def integrate_streamlines(U, V, seed_lon, seed_lat, step=0.5, nsteps=80):
+    grid = (U['lat'].data, U['lon'].data)
+    interp_u = RegularGridInterpolator(
+        grid, U.data, bounds_error=False, fill_value=np.nan
+    )
+    interp_v = RegularGridInterpolator(
+        grid, V.data, bounds_error=False, fill_value=np.nan
+    )
+
+    # Unit vector along the wind in (lon, lat) degrees, taking into account
+    # that meridians converge towards the poles
+    def direction(pos, sign):
+        points = np.column_stack([pos[:, 1], wrap_lon(pos[:, 0], U['lon'])])
+        u = interp_u(points) / np.cos(np.deg2rad(pos[:, 1]))
+        v = interp_v(points)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            speed = np.hypot(u * np.cos(np.deg2rad(pos[:, 1])), v)
+            return sign * np.column_stack([u, v]) / speed[:, np.newaxis]
+
+    # Integrate forward and backward from the seed points
+    halves = []
+    for sign in (1, -1):
+        pos = np.column_stack([seed_lon, seed_lat]).astype(float)
+        path = np.empty((nsteps + 1,) + pos.shape)
+        path[0] = pos
+        for n in range(nsteps):
+            k1 = direction(pos, sign)
+            k2 = direction(pos + 0.5 * step * k1, sign)
+            k3 = direction(pos + 0.5 * step * k2, sign)
+            k4 = direction(pos + step * k3, sign)
+            pos = pos + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            path[n + 1] = pos
+        halves.append(path)
+
+    # Join the two halves into arrays of shape (nseeds, 2 * nsteps + 1)
+    path = np.concatenate([halves[1][::-1], halves[0][1:]])
+    return path[..., 0].T, path[..., 1].T
+
+
+# Hash everything the streamlines depend on (the wind field and its
+# coordinates, the seed points and the integration parameters), so that the
+# cache file of one set of inputs is never reused for different ones
+def streamline_cache_key(U, V, seed_lon, seed_lat, **params):
+    digest = hashlib.sha1()
+    for array in (U.data, V.data, U['lat'].data, U['lon'].data, seed_lon, seed_lat):
+        array = np.ascontiguousarray(array)
+        digest.update(f'{array.dtype}{array.shape}'.encode())
+        digest.update(array.tobytes())
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+# Load the streamlines from the cache file for these inputs if it exists,
+# otherwise integrate them and save them to the cache
+def cached_streamlines(cache_dir, U, V, seed_lon, seed_lat, **kwargs):
+    key = streamline_cache_key(U, V, seed_lon, seed_lat, **kwargs)
+    cache_file = os.path.join(cache_dir, f'streamlines_{key}.npz')
+    if os.path.exists(cache_file):
+        with np.load(cache_file) as cache:
+            return cache['lon'], cache['lat']
+
+    lon, lat = integrate_streamlines(U, V, seed_lon, seed_lat, **kwargs)
+    np.savez(cache_file, lon=lon, lat=lat)
+    return lon, lat
+
+
+# Convert streamlines to the vertex arrays of a LineCollection. Longitudes are
+# wrapped to [-180, 180) and a NaN is inserted where a streamline crosses the
+# dateline, so the line is broken there instead of drawn across the map.
+def streamline_segments(lon, lat):
+    lon = (lon + 180) % 360 - 180
+    jump = np.abs(np.diff(lon, axis=1)) > 180
+    lon[:, 1:][jump] = np.nan
+    return np.stack([lon, lat], axis=-1)
+
+
+################################################################################
+# Integrate the streamlines:
+
+# Seed a streamline every 20 degrees of longitude and 15 degrees of latitude
+seed_lon, seed_lat = np.meshgrid(np.arange(0, 360, 20), np.arange(-75, 76, 15))
+seed_lon = seed_lon.ravel()
+seed_lat = seed_lat.ravel()
+
+stream_lon, stream_lat = cached_streamlines(
+    tempfile.gettempdir(), U, V, seed_lon, seed_lat, step=0.5, nsteps=80
+)
+segments = streamline_segments(stream_lon, stream_lat)
+
+# Average wind speed along each streamline, used to color the second plot
+speed = np.hypot(U, V)
+interp_speed = RegularGridInterpolator(
+    (speed['lat'].data, speed['lon'].data),
+    speed.data,
+    bounds_error=False,
+    fill_value=np.nan,
+)
+line_speed = np.nanmean(
+    interp_speed(np.stack([stream_lat, wrap_lon(stream_lon, U['lon'])], axis=-1)),
+    axis=1,
+)
+
+################################################################################
+# Plot:
+
+# Generate figure (set its size (width, height) in inches) and axes using
+# Cartopy projection
+fig, axs = plt.subplots(
+    2,
+    1,
+    figsize=(12, 12),
+    subplot_kw={"projection": ccrs.PlateCarree()},
+    constrained_layout=True,
+)
+
+# Draw the same streamlines, once in black and once colored by wind speed
+lines = [
+    LineCollection(segments, colors='black', linewidths=0.75, zorder=1),
+    LineCollection(segments, array=line_speed, cmap='viridis', linewidths=1, zorder=1),
+]
+titles = ['Streamlines', 'Streamlines colored by mean wind speed']
+
+for ax, line, title in zip(axs, lines, titles):
+    ax.add_collection(line)
+
+    # Draw filled polygons for land
+    ax.add_feature(cfeature.LAND, zorder=0, edgecolor='black', color='lightgray')
+
+    # Use geocat.viz.util convenience function to set axes tick values
+    gv.set_axes_limits_and_ticks(
+        ax,
+        xlim=(-180, 180),
+        ylim=(-90, 90),
+        xticks=np.linspace(-180, 180, 13),
+        yticks=np.linspace(-90, 90, 7),
+    )
+
+    # Use geocat.viz.util convenience function to add minor and major tick lines
+    gv.add_major_minor_ticks(ax, labelsize=12)
+
+    # Use geocat.viz.util convenience function to make plots look like NCL plots by using latitude, longitude tick labels
+    gv.add_lat_lon_ticklabels(ax)
+
+    # Use geocat.viz.util convenience function to add titles to left and right of the plot axis.
+    gv.set_titles_and_labels(
+        ax,
+        maintitle=title,
+        maintitlefontsize=18,
+        lefttitle=U.long_name,
+        lefttitlefontsize=14,
+        righttitle=U.units,
+        righttitlefontsize=14,
+        xlabel="",
+        ylabel="",
+    )
+
+# Add a colorbar for the wind speed
+fig.colorbar(lines[1], ax=axs[1], orientation='vertical', shrink=0.8, label=U.units)
+
+# Show the plot
+plt.show()
@@ -14,6 +14,7 @@ This script illustrates the following concepts:
   - Moving the vector reference annotation to the top right of the plot
   - Setting the color for vectors
   - Increasing the thickness of vectors
+  - Thinning vectors to a minimum distance on the screen
 
 See following URLs to see the reproduced NCL plot & script:
     - Original NCL script: https://www.ncl.ucar.edu/Applications/Scripts/vector_1.ncl
@@ -56,6 +57,37 @@ v = uv_in['V'].sel(date=198801, lev=1000)
 lat_uv = u['lat']
 lon_uv = u['lon']
 
+###############################################################################
+# Utility function:
+
+
+# Select the grid points to draw vectors at, so that the vectors are roughly
+# `min_distance` pixels apart on the screen whatever the grid resolution or
+# map projection. Grid points are binned into square cells of that size in
+# display coordinates and the first point of each cell is kept. Points more
+# than `margin` pixels (by default `min_distance`) outside of the axes are
+# dropped, so quiver does not build arrows for the parts of a global grid that
+# are not shown. The selection uses the current size and limits of the axes,
+# so it should be made once the layout of the plot is final.
+def thin_vectors(ax, lon, lat, min_distance, margin=None):
+    if margin is None:
+        margin = min_distance
+    ax.apply_aspect()
+    x0, y0, width, height = ax.bbox.bounds
+    lon2d, lat2d = np.meshgrid(lon, lat)
+    xyz = ax.projection.transform_points(ccrs.PlateCarree(), lon2d, lat2d)
+    display = ax.transData.transform(xyz[..., :2].reshape(-1, 2))
+    display -= (x0 - margin, y0 - margin)
+    size = (width + 2 * margin, height + 2 * margin)
+    inside = np.all((display >= 0) & (display <= size), axis=1)
+    cell = (display // min_distance).astype(int)
+    cell_id = cell[:, 1] * (int(size[0] // min_distance) + 1) + cell[:, 0]
+    cell_id = np.where(inside, cell_id, -1)
+    _, first = np.unique(cell_id, return_index=True)
+    first = first[cell_id[first] >= 0]
+    return np.unravel_index(first, lon2d.shape)
+
+
 ###############################################################################
 # Plot:
 
@@ -87,18 +119,6 @@ plt.ylabel("")
 # add land feature
 ax.add_feature(cfeature.LAND, facecolor="lightgrey", zorder=1)
 
-# Add vectors onto the plot
-Q = plt.quiver(
-    lon_uv,
-    lat_uv,
-    u,
-    v,
-    color='white',
-    pivot='middle',
-    width=0.0025,
-    scale=75,
-)
-
 # Use geocat-viz utility function to format title
 gv.set_titles_and_labels(
     ax,
@@ -128,6 +148,42 @@ ax.xaxis.set_major_formatter(LongitudeFormatter(degree_symbol=''))
 # Add minor tick marks
 gv.add_major_minor_ticks(ax, x_minor_per_major=4, y_minor_per_major=4, labelsize=14)
 
+# Add and customize colorbar
+cbar_ticks = np.arange(24, 28.8, 0.3)
+plt.colorbar(
+    ax=ax,
+    mappable=sst_plot,
+    extendrect=True,
+    extendfrac='auto',
+    shrink=0.75,
+    aspect=10,
+    ticks=cbar_ticks,
+    drawedges=True,
+)
+
+# Select the vectors to draw, roughly 20 pixels apart. This is done after the
+# axes limits and colorbar are set, as both change where the grid points end up
+# on the screen. With pivot='middle' an arrow reaches half of its length beyond
+# its grid point, and quiver draws an arrow of speed `s` as `s / scale` of the
+# axes width long, so grid points up to half of the longest arrow outside of
+# the axes are kept as well.
+scale = 75
+ax.apply_aspect()
+margin = max(20, float(np.hypot(u, v).max()) / scale * ax.bbox.width / 2)
+ilat, ilon = thin_vectors(ax, lon_uv, lat_uv, min_distance=20, margin=margin)
+
+# Add vectors onto the plot
+Q = ax.quiver(
+    lon_uv.data[ilon],
+    lat_uv.data[ilat],
+    u.data[ilat, ilon],
+    v.data[ilat, ilon],
+    color='white',
+    pivot='middle',
+    width=0.0025,
+    scale=scale,
+)
+
 # Draw the key for the quiver plot as a rectangle patch
 rect = mpl.patches.Rectangle(
     (91.7, 22.7),  # (x, y)
@@ -151,18 +207,5 @@ qk = ax.quiverkey(
     labelsep=0.1,  # Distance between arrow and label
 )
 
-# Add and customize colorbar
-cbar_ticks = np.arange(24, 28.8, 0.3)
-plt.colorbar(
-    ax=ax,
-    mappable=sst_plot,
-    extendrect=True,
-    extendfrac='auto',
-    shrink=0.75,
-    aspect=10,
-    ticks=cbar_ticks,
-    drawedges=True,
-)
-
 # Show the plot
 plt.show()
@@ -32,12 +32,7 @@ t_size = (tend - tstart + 1) * 12
 
 # Create an array of years from tstart to tend in fractional format
 # This has the same effect as NCL functions yyyymm_time() and yyyymm_to_yyyyfrac()
-date = np.empty(t_size)
-i = 0
-for year in range(tstart, tend + 1):
-    for mo in range(1, 13):  # Loop through all the months
-        date[i] = year + (mo - 1) / 12
-        i += 1
+date = tstart + np.arange(t_size) / 12
 
 # Create random 1D array
 arr = np.random.uniform(-5.0, 10.0, t_size)
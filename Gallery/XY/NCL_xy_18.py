@@ -139,58 +139,92 @@ obs = xr.DataArray(name='TREFHT', data=obs_data, coords=[('time', obs_time)])
 # ---------------------------------
 #
 # We define this function just for convenience.  This is equivalent to how
-# NCL computes the weighted mean.
+# NCL computes the weighted mean, ``sum(var * wgts) / sum(wgts)``, but the
+# weights are normalized once up front so that the mean reduces to a single
+# weighted sum.  ``xarray.dot`` computes that sum per chunk without first
+# materializing the full ``var * wgts`` product.
 
 
-def horizontal_weighted_mean(var, wgts):
-    return (var * wgts).sum(dim=['lat', 'lon']) / wgts.sum(dim=['lat', 'lon'])
+def normalize_weights(wgts):
+    return wgts / wgts.sum(dim=['lat', 'lon'])
 
 
-###############################################################################
-# Natural data:
-# -------------
-#
-# We compute the weighted mean across the latitude and longitude dimensions
-# (leaving only the ``case`` and ``time`` dimensions), and then we compute the
-# anomaly measured from the average of the first 30 years.
+def horizontal_weighted_mean(var, norm_wgts):
+    return xr.dot(var, norm_wgts, dim=['lat', 'lon'])
+
 
-gavn = horizontal_weighted_mean(nds["TREFHT"], gds["gw"])
-gavan = gavn - gavn.sel(time=slice('1890', '1920')).mean(dim='time')
+# Normalize the weights once and reuse them for every ensemble member
+norm_wgts = normalize_weights(gds["gw"])
 
 ###############################################################################
-# Natural + Anthropogenic data:
-# -----------------------------
+# Ensemble global means:
+# ----------------------
 #
-# We do the same thing for the "natural + anthropogenic" data.
-
-gavv = horizontal_weighted_mean(vds["TREFHT"], gds["gw"])
-gavav = gavv - gavv.sel(time=slice('1890', '1920')).mean(dim='time')
+# Rather than reducing each ensemble separately, we stack the "natural" and
+# "natural + anthropogenic" ensembles along a new ``experiment`` dimension so
+# that the weighted mean of every member is computed in one sweep over the
+# data.  Because the datasets were opened with ``open_mfdataset``, the
+# reduction stays lazy until the anomalies below are computed.
+
+trefht = xr.concat(
+    [nds["TREFHT"], vds["TREFHT"]],
+    dim=xr.Variable('experiment', ['natural', 'anthropogenic']),
+)
+gav = horizontal_weighted_mean(trefht, norm_wgts)
 
 ###############################################################################
-# Observation data:
+# Anomaly Function:
 # -----------------
 #
-# We do the same thing for the observation data.
+# The anomaly is measured from the average of the first 30 years.  We define
+# this function so the same baseline period is applied to the model ensembles
+# and to the observations.
+
+
+def baseline_anomaly(var, baseline=slice('1890', '1920')):
+    return var - var.sel(time=baseline).mean(dim='time')
 
-obs_avg = obs.sel(time=slice('1890', '1999')) - obs.sel(
-    time=slice('1890', '1920')
-).mean(dim='time')
 
 ###############################################################################
-# Calculate the ensemble Min. & Max. & Mean:
-# ------------------------------------------
+# Model data:
+# -----------
 #
-# Here we find the ``min``, ``max``, and ``mean`` along the ``case`` (i.e.,
-# ensemble) dimension (leaving only the ``time`` dimension) for both of our
-# datasets.  We compute the equivalent anomaly for the observations data.
+# We compute the anomalies of every member of both ensembles at once, and
+# then find the ``min``, ``max``, and ``mean`` along the ``case`` (i.e.,
+# ensemble) dimension (leaving only the ``experiment`` and ``time``
+# dimensions).  Collecting these into a single ``Dataset`` and calling
+# ``compute`` once lets Dask evaluate the weighted means, baselines,
+# anomalies and ensemble envelopes in one pass over the data, rather than
+# once per quantity.
+
+gava = baseline_anomaly(gav)
+envelope = xr.Dataset(
+    {
+        'min': gava.min(dim='case'),
+        'max': gava.max(dim='case'),
+        'mean': gava.mean(dim='case'),
+    }
+).compute()
+
+# Natural data
+gavan = envelope.sel(experiment='natural', drop=True)
+gavan_min = gavan['min']
+gavan_max = gavan['max']
+gavan_avg = gavan['mean']
+
+# Natural + Anthropogenic data
+gavav = envelope.sel(experiment='anthropogenic', drop=True)
+gavav_min = gavav['min']
+gavav_max = gavav['max']
+gavav_avg = gavav['mean']
 
-gavan_min = gavan.min(dim='case')
-gavan_max = gavan.max(dim='case')
-gavan_avg = gavan.mean(dim='case')
+###############################################################################
+# Observation data:
+# -----------------
+#
+# We compute the equivalent anomaly for the observations data.
 
-gavav_min = gavav.min(dim='case')
-gavav_max = gavav.max(dim='case')
-gavav_avg = gavav.mean(dim='case')
+obs_avg = baseline_anomaly(obs).sel(time=slice('1890', '1999'))
 
 ###############################################################################
 # Plot:
@@ -30,12 +30,8 @@ date = ds.date
 # Dates in the file are represented by year and month (YYYYMM)
 # representing them fractionally will make plotting the data easier
 # This produces the same results as NCL's yyyymm_to_yyyyfrac() function
-num_months = np.shape(date)[0]
-date_frac = np.empty_like(date)
-for n in np.arange(0, num_months, 1):
-    yyyy = int(date[n] / 100)
-    mon = (date[n] / 100 - yyyy) * 100
-    date_frac[n] = yyyy + (mon - 1) / 12
+yyyy, mm = np.divmod(date.values.astype(int), 100)
+date_frac = yyyy + (mm - 1) / 12
 
 ###############################################################################
 # Plot:
@@ -43,11 +39,9 @@ for n in np.arange(0, num_months, 1):
 # Create a list of years
 warm_yrs = [1951, 1953, 1957, 1963, 1965, 1969, 1972, 1976, 1982, 1987, 1991]
 
-# Create a list of sst values corresponding to values in warm_yrs
-y = []
-for year in warm_yrs:
-    index = int((np.where(np.round(date_frac, 3) == year)[0]).item())
-    y.append(sst[index])
+# Select the sst values corresponding to values in warm_yrs, looking up the
+# index of each year in the sorted dates
+y = sst[np.searchsorted(date_frac, warm_yrs)]
 
 # Create figure (setting figure size (width,height) in inches) and axes
 plt.figure(figsize=(7, 6.5))